@@ -132,14 +132,20 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
         self.campus_supply_topic = "{}/campus/{}/supply".format(self.db_topic, self.name)
         self.system_loss_topic = "{}/{}/system_loss".format(self.db_topic, self.name)
         self.dc_threshold_topic = "{}/{}/dc_threshold_topic".format(self.db_topic, self.name)
+        self.campus_supply_record_topic = "{}/{}/CampusSupply".format(self.db_topic, self.name)
+        self.aggregate_demand_topic = "{}/{}/AggregateDemand".format(self.db_topic, self.name)
+        self.price_record_topic = "{}/{}/Price".format(self.db_topic, self.name)
+        self.mixmarket_start_topic = 'mixmarket/start_new_cycle'
 
         self.mix_market_running = False
+        self.building_meter = None
         verbose_logging = self.config.get('verbose_logging', True)
 
-        self.prices = [None for i in range(25)]
-        self.quantities = [None for i in range(25)]
-        self.building_demand_curves = [None for i in range(25)]
+        self.prices = [None] * 25
+        self.quantities = [None] * 25
+        self.building_demand_curves = [None] * 25
         self.mix_market_duration = timedelta(minutes=20)
+        self.mix_market_duration_secs = self.mix_market_duration.total_seconds()
 
         self.reschedule_interval = timedelta(minutes=10, seconds=1)
 
@@ -153,9 +159,11 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
 
         # Create market names to join
         self.base_market_name = 'electric'  # Need to agree on this with other market agents
-        self.market_names = []
-        for i in range(24):
-            self.market_names.append('_'.join([self.base_market_name, str(i)]))
+        self.market_names = ['_'.join([self.base_market_name, str(i)]) for i in range(24)]
+        # Market name -> index lookup used by the mixmarket callbacks
+        self.market_index = {name: i for i, name in enumerate(self.market_names)}
+        # Last supply curve offered per market index, as (price, curve)
+        self.offer_curves = {}
 
         Timer.created_time = datetime.now()
         Timer.simulation = self.simulation
@@ -190,25 +198,24 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
                                   callback=self.new_demand_signal)
 
     def new_supply_signal(self, peer, sender, bus, topic, headers, message):
-        _log.debug("At {}, {} receives new supply records: {}".format(Timer.get_cur_time(),
-                                                                     self.name, message))
+        now = Timer.get_cur_time()
+        _log.debug("At %s, %s receives new supply records: %s", now,
+                   self.name, message)
         supply_curves = message['curves']
         start_of_cycle = message['start_of_cycle']
 
         self.campus.model.receive_transactive_signal(self, supply_curves)
-        _log.debug("At {}, mixmarket state is {}, start_of_cycle {}".format(Timer.get_cur_time(),
-                                                                            self.mix_market_running,
-                                                                            start_of_cycle))
+        _log.debug("At %s, mixmarket state is %s, start_of_cycle %s", now,
+                   self.mix_market_running, start_of_cycle)
 
-        db_topic = "/".join([self.db_topic, self.name, "CampusSupply"])
         message = supply_curves
-        headers = {headers_mod.DATE: format_timestamp(Timer.get_cur_time())}
-        self.vip.pubsub.publish("pubsub", db_topic, headers, message).get()
+        headers = {headers_mod.DATE: format_timestamp(now)}
+        self.vip.pubsub.publish("pubsub", self.campus_supply_record_topic, headers, message)
 
         if start_of_cycle:
-            _log.debug("At {}, start of cycle. "
-                       "Mixmarket state before overriding is {}".format(Timer.get_cur_time(),
-                                                                        self.mix_market_running))
+            _log.debug("At %s, start of cycle. "
+                       "Mixmarket state before overriding is %s", now,
+                       self.mix_market_running)
 
             # if self.simulation:
             #     self.run_ep_sim(start_of_cycle)
@@ -216,9 +223,8 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
             self.start_mixmarket(start_of_cycle)
 
     def new_demand_signal(self, peer, sender, bus, topic, headers, message):
-        mtrs = self.campus.model.meterPoints
-        if len(mtrs) > 0:
-            bldg_meter = mtrs[0]
+        bldg_meter = self.building_meter
+        if bldg_meter is not None:
             power_unit = message[1]
             cur_power = float(message[0]["WholeBuildingPower"])
             power_unit = power_unit.get("WholeBuildingPower", {}).get("units", "kW")
@@ -230,23 +236,24 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
 
     def near_end_of_hour(self, now):
         near_end_of_hour = False
-        if (now + self.mix_market_duration).hour != now.hour:
+        # Seconds into the hour plus the mix market duration crosses the hour boundary
+        if now.minute * 60 + now.second + now.microsecond / 1e6 + self.mix_market_duration_secs >= 3600:
             near_end_of_hour = True
-            _log.debug("{} did not start mixmarket because it's too late.".format(self.name))
+            _log.debug("%s did not start mixmarket because it's too late.", self.name)
 
         return near_end_of_hour
 
     def start_mixmarket(self, start_of_cycle):
         # Reset price array
-        self.prices = [None for i in range(25)]
+        self.prices = [None] * 25
 
         # Save the 1st quantity as prior 2nd quantity
         cur_quantity = self.quantities[1]
         cur_curve = self.building_demand_curves[1]
 
         # Reset quantities and curves
-        self.quantities = [None for i in range(25)]
-        self.building_demand_curves = [None for i in range(25)]
+        self.quantities = [None] * 25
+        self.building_demand_curves = [None] * 25
 
         # If new cycle, set the 1st quantity to the corresponding quantity of previous hour
         if start_of_cycle:
@@ -257,24 +264,17 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
         market = self.markets[0]  # Assume only 1 TNS market per node
         market.signal_new_data = True
         market.balance(self)
-
-        # Check if now is near the end of the hour, applicable only if not in simulation mode
         now = Timer.get_cur_time()
-        near_end_of_hour = False
-        if not self.simulation:
-            near_end_of_hour = self.near_end_of_hour(now)
 
         if market.converged:
             # Get new prices (expected 25 values: current hour + next 24)
-            prices = market.marginalPrices
-
             # There is a case where the balancing happens at the end of the hour and continues to the next hour, which
             # creates 26 values. Get the last 25 values.
-            prices = prices[-25:]
-            self.prices = [p.value for p in prices]
+            self.prices = [p.value for p in market.marginalPrices[-25:]]
 
-            # Signal to start mix market only if the previous market is done
-            if not self.mix_market_running and not near_end_of_hour:
+            # Signal to start mix market only if the previous market is done and, when not in simulation mode,
+            # now is not near the end of the hour
+            if not self.mix_market_running and (self.simulation or not self.near_end_of_hour(now)):
                 self.mix_market_running = True
                 # Update weather information
                 weather_service = None
@@ -282,21 +282,16 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
                     weather_service = self.informationServiceModels[0]
                     weather_service.update_information(market)
 
-                _log.debug("prices are {}".format(self.prices))
-                if weather_service is None:
-                    self.vip.pubsub.publish(peer='pubsub',
-                                            topic='mixmarket/start_new_cycle',
-                                            message={"prices": self.prices[-24:],
-                                                     "Date": format_timestamp(now)})
-                else:
-                    temps = [x.value for x in weather_service.predictedValues]
-                    temps = temps[-24:]
-                    _log.debug("temps are {}".format(temps))
-                    self.vip.pubsub.publish(peer='pubsub',
-                                            topic='mixmarket/start_new_cycle',
-                                            message={"prices": self.prices[-24:],
-                                                     "temp": temps,
-                                                     "Date": format_timestamp(now)})
+                _log.debug("prices are %s", self.prices)
+                message = {"prices": self.prices[-24:],
+                           "Date": format_timestamp(now)}
+                if weather_service is not None:
+                    temps = [x.value for x in weather_service.predictedValues[-24:]]
+                    _log.debug("temps are %s", temps)
+                    message["temp"] = temps
+                self.vip.pubsub.publish(peer='pubsub',
+                                        topic=self.mixmarket_start_topic,
+                                        message=message)
 
     def balance_market(self, run_cnt):
         market = self.markets[0]  # Assume only 1 TNS market per node
@@ -304,11 +299,12 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
         market.balance(self)
 
         if market.converged:
-            _log.debug("TNS market {} balanced successfully.".format(market.name))
-            balanced_curves = [(x.timeInterval.startTime,
-                                x.value.marginalPrice,
-                                x.value.power) for x in market.activeVertices]
-            _log.debug("Balanced curves: {}".format(balanced_curves))
+            _log.debug("TNS market %s balanced successfully.", market.name)
+            if _log.isEnabledFor(logging.DEBUG):
+                balanced_curves = [(x.timeInterval.startTime,
+                                    x.value.marginalPrice,
+                                    x.value.power) for x in market.activeVertices]
+                _log.debug("Balanced curves: %s", balanced_curves)
 
             # Sum all the powers as will be needed by the net supply/demand curve.
             market.assign_system_vertices(self)
@@ -321,9 +317,9 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
                 self.campus.model.send_transactive_signal(self, self.building_demand_topic)
 
     def offer_callback(self, timestamp, market_name, buyer_seller):
-        if market_name in self.market_names:
+        if market_name in self.market_index:
             # Get the price for the corresponding market
-            idx = int(market_name.split('_')[-1])
+            idx = self.market_index[market_name]
             price = self.prices[idx+1]
             #price *= 1000.  # Convert to mWh to be compatible with the mixmarket
 
@@ -331,19 +327,21 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
             min_quantity = 0
             max_quantity = 10000  # float("inf")
 
-            # Create supply curve
-            supply_curve = PolyLine()
-            supply_curve.add(Point(quantity=min_quantity, price=price))
-            supply_curve.add(Point(quantity=max_quantity, price=price))
+            # Create supply curve, reusing the last one offered in this market if the price is unchanged
+            offer = self.offer_curves.get(idx)
+            if offer is not None and offer[0] == price:
+                supply_curve = offer[1]
+            else:
+                supply_curve = PolyLine()
+                supply_curve.add(Point(quantity=min_quantity, price=price))
+                supply_curve.add(Point(quantity=max_quantity, price=price))
+                self.offer_curves[idx] = (price, supply_curve)
 
             # Make offer
-            _log.debug("{}: offer for {} as {} at {} - Curve: {} {}".format(self.agent_name,
-                                                                         market_name,
-                                                                         SELLER,
-                                                                         timestamp,
-                                                                         supply_curve.points[0], supply_curve.points[1]))
+            _log.debug("%s: offer for %s as %s at %s - Curve: %s %s", self.agent_name, market_name, SELLER,
+                       timestamp, supply_curve.points[0], supply_curve.points[1])
             success, message = self.make_offer(market_name, SELLER, supply_curve)
-            _log.debug("{}: offer has {} - Message: {}".format(self.agent_name, success, message))
+            _log.debug("%s: offer has %s - Message: %s", self.agent_name, success, message)
 
     def init_objects(self):
         # Add meter
@@ -442,6 +440,9 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
         building_meter.measurementType = MeasurementType.AverageDemandkW
         building_meter.measurementUnit = MeasurementUnit.kWh
         campus_model.meterPoints.append(building_meter)
+        # Resolved once here so new_demand_signal need not walk the campus
+        # model on every power reading
+        self.building_meter = building_meter
 
         # Cross-reference object & model
         campus_model.object = campus
@@ -454,106 +455,88 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
 
     # Dummy callbacks
     def aggregate_power(self, peer, sender, bus, topic, headers, message):
-        _log.debug("{}: received topic for power aggregation: {}".format(self.agent_name,
-                                                                         topic))
+        _log.debug("%s: received topic for power aggregation: %s", self.agent_name, topic)
         data = message[0]
-        _log.debug("{}: updating power aggregation: {}".format(self.agent_name,
-                                                               data))
+        _log.debug("%s: updating power aggregation: %s", self.agent_name, data)
 
     def reservation_callback(self, timestamp, market_name, buyer_seller):
-        _log.debug("{}: wants reservation for {} as {} at {}".format(self.agent_name,
-                                                                           market_name,
-                                                                           buyer_seller,
-                                                                           timestamp))
+        _log.debug("%s: wants reservation for %s as %s at %s", self.agent_name, market_name, buyer_seller,
+                   timestamp)
         return True
 
     def aggregate_callback(self, timestamp, market_name, buyer_seller, aggregate_demand):
-        if buyer_seller == BUYER and market_name in self.market_names:  # self.base_market_name in market_name:
-            _log.debug("{}: at ts {} min of aggregate curve : {}".format(self.agent_name,
-                                                                         timestamp,
-                                                                         aggregate_demand.points[0]))
-            _log.debug("{}: at ts {} max of aggregate curve : {}".format(self.agent_name,
-                                                                         timestamp,
-                                                                         aggregate_demand.points[- 1]))
-            _log.debug("At {}: Report aggregate Market: {} buyer Curve: {}".format(Timer.get_cur_time(),
-                                                                                   market_name,
-                                                                                   aggregate_demand))
-            idx = int(market_name.split('_')[-1])
+        if buyer_seller == BUYER and market_name in self.market_index:  # self.base_market_name in market_name:
+            points = aggregate_demand.points
+            min_point, max_point = points[0], points[-1]
+            _log.debug("%s: at ts %s min of aggregate curve : %s", self.agent_name, timestamp, min_point)
+            _log.debug("%s: at ts %s max of aggregate curve : %s", self.agent_name, timestamp, max_point)
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("At %s: Report aggregate Market: %s buyer Curve: %s", Timer.get_cur_time(),
+                           market_name, aggregate_demand)
+            idx = self.market_index[market_name]
             idx += 1  # quantity has 25 values while there are 24 future markets
-            self.building_demand_curves[idx] = (aggregate_demand.points[0], aggregate_demand.points[-1])
+            self.building_demand_curves[idx] = (min_point, max_point)
 
     def price_callback(self, timestamp, market_name, buyer_seller, price, quantity):
-        _log.debug("{}: cleared price ({}, {}) for {} as {} at {}".format(Timer.get_cur_time(),
-                                                                          price,
-                                                                          quantity,
-                                                                          market_name,
-                                                                          buyer_seller,
-                                                                          timestamp))
-        idx = int(market_name.split('_')[-1])
-        self.prices[idx+1] = price  # price has 24 values, current hour price is excluded
+        now = Timer.get_cur_time()
+        _log.debug("%s: cleared price (%s, %s) for %s as %s at %s", now, price, quantity, market_name,
+                   buyer_seller, timestamp)
         if price is None:
-            raise "Market {} did not clear. Price is none.".format(market_name)
+            _log.error("Market %s did not clear. Price is none.", market_name)
+            return
+        idx = self.market_index[market_name]
+        self.prices[idx+1] = price  # price has 24 values, current hour price is excluded
         idx += 1  # quantity has 25 values while there are 24 future markets
         if self.quantities[idx] is None:
             self.quantities[idx] = 0.
         if quantity is None:
             _log.error("Quantity is None. Set it to 0. Details below.")
-            _log.debug("{}: ({}, {}) for {} as {} at {}".format(self.agent_name,
-                                                                price,
-                                                                quantity,
-                                                                market_name,
-                                                                buyer_seller,
-                                                                timestamp))
+            _log.debug("%s: (%s, %s) for %s as %s at %s", self.agent_name, price, quantity, market_name,
+                       buyer_seller, timestamp)
             quantity = 0
         self.quantities[idx] += quantity
 
-        _log.debug("At {}, Quantity is {} and quantities are: {}".format(Timer.get_cur_time(),
-                                                                         quantity,
-                                                                         self.quantities))
+        _log.debug("At %s, Quantity is %s and quantities are: %s", now, quantity, self.quantities)
         if quantity is not None and quantity < 0:
-            _log.error("Quantity received from mixmarket is negative!!! {}".format(quantity))
+            _log.error("Quantity received from mixmarket is negative!!! %s", quantity)
 
         # If all markets (ie. exclude 1st value) are done then update demands, otherwise do nothing
-        mix_market_done = all([False if q is None else True for q in self.quantities[1:]])
+        mix_market_done = all(q is not None for q in self.quantities[1:])
         if mix_market_done:
             # Check if any quantity is greater than physical limit of the supply wire
-            _log.debug("Quantity: {}".format(self.quantities))
-            if not all([False if q > self.max_deliver_capacity else True for q in self.quantities[1:]]):
-                _log.error("One of quantity is greater than "
-                           "physical limit {}".format(self.max_deliver_capacity))
+            _log.debug("Quantity: %s", self.quantities)
+            if any(q is not None and q > self.max_deliver_capacity for q in self.quantities[1:]):
+                _log.error("One of quantity is greater than physical limit %s", self.max_deliver_capacity)
 
             # Check demand curves exist
-            all_curves_exist = all([False if q is None else True for q in self.building_demand_curves[1:]])
+            all_curves_exist = all(c is not None for c in self.building_demand_curves[1:])
             if not all_curves_exist:
-                _log.error("Demand curves: {}".format(self.building_demand_curves))
-                raise "Mix market has all quantities but not all demand curves"
+                _log.error("Demand curves: %s", self.building_demand_curves)
+                raise RuntimeError("Mix market has all quantities but not all demand curves")
 
             # Update demand and balance market
             self.mix_market_running = False
+            interval_names = [ti.name for ti in self.markets[0].timeIntervals]
             #self.elastive_load_model.default_powers = [-q if q is not None else None for q in self.quantities]
-            curves_arr = [(c[0].tuppleize(), c[1].tuppleize()) if c is not None else None
-                          for c in self.building_demand_curves]
-            _log.debug("Data at time {}:".format(Timer.get_cur_time()))
-            _log.debug("Market intervals: {}".format([x.name for x in self.markets[0].timeIntervals]))
-            _log.debug("Quantities: {}".format(self.quantities))
-            _log.debug("Prices: {}".format(self.prices))
-            _log.debug("Curves: {}".format(curves_arr))
-
-            db_topic = "/".join([self.db_topic, self.name, "AggregateDemand"])
-            message = {"Timestamp": format_timestamp(timestamp), "Curves": self.building_demand_curves}
-            headers = {headers_mod.DATE: format_timestamp(Timer.get_cur_time())}
-            self.vip.pubsub.publish("pubsub", db_topic, headers, message).get()
-
-            db_topic = "/".join([self.db_topic, self.name, "Price"])
-            price_message = []
-            for i in range(len(self.markets[0].timeIntervals)):
-                ts = self.markets[0].timeIntervals[i].name
-                price = self.prices[i]
-                quantity = self.quantities[i]
-                price_message.append({'timeInterval': ts, 'price': price, 'quantity': quantity})
-            message = {"Timestamp": format_timestamp(timestamp), "Price": price_message}
-            headers = {headers_mod.DATE: format_timestamp(Timer.get_cur_time())}
-            self.vip.pubsub.publish("pubsub", db_topic, headers, message).get()
+            if _log.isEnabledFor(logging.DEBUG):
+                curves_arr = [(c[0].tuppleize(), c[1].tuppleize()) if c is not None else None
+                              for c in self.building_demand_curves]
+                _log.debug("Data at time %s:", now)
+                _log.debug("Market intervals: %s", interval_names)
+                _log.debug("Quantities: %s", self.quantities)
+                _log.debug("Prices: %s", self.prices)
+                _log.debug("Curves: %s", curves_arr)
+
+            timestamp_str = format_timestamp(timestamp)
+            now_str = format_timestamp(now)
+            headers = {headers_mod.DATE: now_str}
+            message = {"Timestamp": timestamp_str, "Curves": self.building_demand_curves}
+            self.vip.pubsub.publish("pubsub", self.aggregate_demand_topic, headers, message)
+
+            price_message = [{'timeInterval': ts, 'price': p, 'quantity': q}
+                             for ts, p, q in zip(interval_names, self.prices, self.quantities)]
+            message = {"Timestamp": timestamp_str, "Price": price_message}
+            self.vip.pubsub.publish("pubsub", self.price_record_topic, headers, message)
 
             self.elastive_load_model.set_tcc_curves(self.quantities,
                                                     self.prices,
@@ -562,15 +545,15 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
 
     def run_ep_sim(self, start_of_cycle):
         # Reset price array
-        self.prices = [None for i in range(25)]
+        self.prices = [None] * 25
 
         # Save the 1st quantity as prior 2nd quantity
         cur_quantity = self.quantities[1]
         cur_curve = self.building_demand_curves[1]
 
         # Reset quantities and curves
-        self.quantities = [None for i in range(25)]
-        self.building_demand_curves = [None for i in range(25)]
+        self.quantities = [None] * 25
+        self.building_demand_curves = [None] * 25
 
         # If new cycle, set the 1st quantity to the corresponding quantity of previous hour
         if start_of_cycle:
@@ -581,24 +564,17 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
         market = self.markets[0]  # Assume only 1 TNS market per node
         market.signal_new_data = True
         market.balance(self)
-
-        # Check if now is near the end of the hour, applicable only if not in simulation mode
         now = Timer.get_cur_time()
-        near_end_of_hour = False
-        if not self.simulation:
-            near_end_of_hour = self.near_end_of_hour(now)
 
         if market.converged:
             # Get new prices (expected 25 values: current hour + next 24)
-            prices = market.marginalPrices
-
             # There is a case where the balancing happens at the end of the hour and continues to the next hour, which
             # creates 26 values. Get the last 25 values.
-            prices = prices[-25:]
-            self.prices = [p.value for p in prices]
+            self.prices = [p.value for p in market.marginalPrices[-25:]]
 
-            # Signal to start mix market only if the previous market is done
-            if not self.mix_market_running and not near_end_of_hour:
+            # Signal to start mix market only if the previous market is done and, when not in simulation mode,
+            # now is not near the end of the hour
+            if not self.mix_market_running and (self.simulation or not self.near_end_of_hour(now)):
                 self.mix_market_running = True
 
             # Read data from e+ output file
@@ -636,11 +612,8 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
             # End E+ output reading
 
     def error_callback(self, timestamp, market_name, buyer_seller, error_code, error_message, aux):
-        _log.debug("{}: error for {} as {} at {} - Message: {}".format(self.agent_name,
-                                                                       market_name,
-                                                                       buyer_seller,
-                                                                       timestamp,
-                                                                       error_message))
+        _log.debug("%s: error for %s as %s at %s - Message: %s", self.agent_name, market_name, buyer_seller,
+                   timestamp, error_message)
 
 
 def main(argv=sys.argv):
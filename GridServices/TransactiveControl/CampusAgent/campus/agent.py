@@ -93,11 +93,13 @@ class CampusAgent(Agent, myTransactiveNode):
         self.monthly_peak_power = float(self.config.get('monthly_peak_power'))
 
         self.neighbors = []
+        self.building_neighbors = {}
 
         self.city_supply_topic = "{}/city/campus/supply".format(self.db_topic)
         self.building_demand_topic = "/".join([self.db_topic, "{}/campus/demand"])
         self.campus_demand_topic = "{}/campus/city/demand".format(self.db_topic)
         self.campus_supply_topic = "/".join([self.db_topic, "campus/{}/supply"])
+        self.building_supply_topics = {bldg: self.campus_supply_topic.format(bldg) for bldg in self.building_names}
         self.solar_topic = "/".join([self.db_topic, "campus/pv"])
         self.system_loss_topic = "{}/{}/system_loss".format(self.db_topic, self.name)
         self.dc_threshold_topic = "{}/{}/dc_threshold_topic".format(self.db_topic, self.name)
@@ -130,28 +132,27 @@ class CampusAgent(Agent, myTransactiveNode):
                                       callback=self.new_demand_signal)
 
     def new_demand_signal(self, peer, sender, bus, topic, headers, message):
-        _log.debug("At {}, {} receives new demand records: {}".format(Timer.get_cur_time(),
-                                                                     self.name, message))
+        _log.debug("At %s, %s receives new demand records: %s", Timer.get_cur_time(),
+                   self.name, message)
         building_name = message['source']
         demand_curves = message['curves']
         start_of_cycle = message['start_of_cycle']
         fail_to_converged = message['fail_to_converged']
 
-        neighbors = [n for n in self.neighbors if n.name == building_name]
-        if len(neighbors) == 1:
-            neighbor = neighbors[0]
+        neighbor = self.building_neighbors.get(building_name)
+        if neighbor is not None:
             neighbor.model.receive_transactive_signal(self, demand_curves)
             self.balance_market(1, start_of_cycle, fail_to_converged, neighbor)
         else:
-            _log.error("{}: There are {} building(s) with name {}."
-                       .format(self.name, len(neighbors), building_name))
+            _log.error("{}: There is no building with name {}."
+                       .format(self.name, building_name))
             _log.error("Neighbors are: {}".format([x.name for x in self.neighbors]))
             _log.error("Message is: {}".format(message))
             _log.error("Check value of 'name' key in the config file for building {}.".format(building_name))
 
     def new_supply_signal(self, peer, sender, bus, topic, headers, message):
-        _log.debug("At {}, {} receives new supply records: {}".format(Timer.get_cur_time(),
-                                                                     self.name, message))
+        _log.debug("At %s, %s receives new supply records: %s", Timer.get_cur_time(),
+                   self.name, message)
         source = message['source']
         supply_curves = message['curves']
         start_of_cycle = message['start_of_cycle']
@@ -176,37 +177,37 @@ class CampusAgent(Agent, myTransactiveNode):
             # Send only if either of the 2 conditions below occurs:
             # 1) Model balancing did not converge
             # 2) A new cycle (ie. begin of hour)
+            city = self.city
             for n in self.neighbors:
+                model = n.model
+                # Signals go up to the city on the demand topic and down to each building on its supply topic
+                topic = self.campus_demand_topic
+                if n != city:
+                    topic = self.building_supply_topics[n.name]
+
                 # If the neighbor failed to converge (eg., building1 failed to converge)
                 if n == fail_to_converged_neighbor and n is not None:
-                    n.model.prep_transactive_signal(market, self)
-                    topic = self.campus_demand_topic
-                    if n != self.city:
-                        topic = self.campus_supply_topic.format(n.name)
-                    n.model.send_transactive_signal(self, topic, start_of_cycle)
-                    _log.debug("NeighborModel {} sent records.".format(n.model.name))
+                    model.prep_transactive_signal(market, self)
+                    model.send_transactive_signal(self, topic, start_of_cycle)
+                    _log.debug("NeighborModel {} sent records.".format(model.name))
 
                 else:
                     # Always send signal downstream at the start of a new cyle
                     if start_of_cycle:
-                        if n != self.city:
-                            n.model.prep_transactive_signal(market, self)
-                            topic = self.campus_supply_topic.format(n.name)
-                            n.model.send_transactive_signal(self, topic, start_of_cycle)
-                            _log.debug("NeighborModel {} sent records.".format(n.model.name))
+                        if n != city:
+                            model.prep_transactive_signal(market, self)
+                            model.send_transactive_signal(self, topic, start_of_cycle)
+                            _log.debug("NeighborModel {} sent records.".format(model.name))
                     else:
-                        _log.debug("Not start of cycle. Check convergence for neighbor {}.".format(n.model.name))
-                        n.model.check_for_convergence(market)
-                        if not n.model.converged:
-                            n.model.prep_transactive_signal(market, self)
-                            topic = self.campus_demand_topic
-                            if n != self.city:
-                                topic = self.campus_supply_topic.format(n.name)
-                            n.model.send_transactive_signal(self, topic, start_of_cycle)
-                            _log.debug("NeighborModel {} sent records.".format(n.model.name))
+                        _log.debug("Not start of cycle. Check convergence for neighbor {}.".format(model.name))
+                        model.check_for_convergence(market)
+                        if not model.converged:
+                            model.prep_transactive_signal(market, self)
+                            model.send_transactive_signal(self, topic, start_of_cycle)
+                            _log.debug("NeighborModel {} sent records.".format(model.name))
                         else:
                             _log.debug("{} ({}) did not send records due to check_for_convergence()."
-                                       .format(n.model.name, self.name))
+                                       .format(model.name, self.name))
 
             # Schedule rerun balancing if not in simulation mode
             if not self.simulation:
@@ -220,12 +221,9 @@ class CampusAgent(Agent, myTransactiveNode):
                         if dt.hour == next_run_dt.hour and run_cnt >= 1:
                             _log.debug("{} reschedule to run at {}".format(self.name, next_run_dt))
                             self.core.schedule(next_run_dt, self.balance_market, run_cnt + 1)
-            prices = market.marginalPrices
-
             # There is a case where the balancing happens at the end of the hour and continues to the next hour, which
             # creates 26 values. Get the last 25 values.
-            prices = prices[-25:]
-            prices = [x.value for x in prices]
+            prices = [x.value for x in market.marginalPrices[-25:]]
             self.vip.pubsub.publish(peer='pubsub',
                                         topic=self.price_topic,
                                         message={'prices': prices,
@@ -345,8 +343,12 @@ class CampusAgent(Agent, myTransactiveNode):
 
         # Add buildings
         for bldg_name in self.building_names:
+            if bldg_name in self.building_neighbors:
+                raise ValueError("{}: building {} is listed more than once in "
+                                 "the 'buildings' config.".format(self.name, bldg_name))
             bldg_neighbor = self.make_bldg_neighbor(bldg_name)
             self.neighbors.append(bldg_neighbor)
+            self.building_neighbors[bldg_name] = bldg_neighbor
 
     def make_bldg_neighbor(self, name):
         bldg_powers = self.building_powers[name]
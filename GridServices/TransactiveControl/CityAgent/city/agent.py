@@ -173,9 +173,7 @@ class CityAgent(Agent, myTransactiveNode):
         # Balance
         market = self.markets[0]  # Assume only 1 TNS market per node
         market.balance(self)
-        prices = market.marginalPrices
-        prices = prices[-25:]
-        prices = [x.value for x in prices]
+        prices = [x.value for x in market.marginalPrices[-25:]]
         _time = format_timestamp(Timer.get_cur_time())
         self.vip.pubsub.publish(peer='pubsub',
                                 topic=self.price_topic,
@@ -197,8 +195,8 @@ class CityAgent(Agent, myTransactiveNode):
                            start_of_cycle=True)
 
     def new_demand_signal(self, peer, sender, bus, topic, headers, message):
-        _log.debug("At {}, {} receives new demand records: {}".format(Timer.get_cur_time(),
-                                                                     self.name, message))
+        _log.debug("At %s, %s receives new demand records: %s", Timer.get_cur_time(),
+                   self.name, message)
         demand_curves = message['curves']
 
         # Should not do anything with start_of_cycle signal
@@ -231,12 +229,9 @@ class CityAgent(Agent, myTransactiveNode):
                     if dt.hour == next_run_dt.hour and run_cnt >= 1:
                         _log.debug("{} reschedule to run at {}".format(self.name, next_run_dt))
                         self.core.schedule(next_run_dt, self.balance_market, run_cnt + 1)
-            prices = market.marginalPrices
-
             # There is a case where the balancing happens at the end of the hour and continues to the next hour, which
             # creates 26 values. Get the last 25 values.
-            prices = prices[-25:]
-            prices = [x.value for x in prices]
+            prices = [x.value for x in market.marginalPrices[-25:]]
             self.vip.pubsub.publish(peer='pubsub',
                                         topic=self.price_topic,
                                         message={'prices': prices,
@@ -489,10 +489,11 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
                                                                           market_name,
                                                                           buyer_seller,
                                                                           timestamp))
+        if price is None:
+            _log.error("Market %s did not clear. Price is none.", market_name)
+            return
         idx = int(market_name.split('_')[-1])
         self.prices[idx+1] = price  # price has 24 values, current hour price is excluded
-        if price is None:
-            raise "Market {} did not clear. Price is none.".format(market_name)
         idx += 1  # quantity has 25 values while there are 24 future markets
         if self.quantities[idx] is None:
             self.quantities[idx] = 0.
@@ -526,7 +527,7 @@ class BuildingAgent(MarketAgent, myTransactiveNode):
             all_curves_exist = all([False if q is None else True for q in self.building_demand_curves[1:]])
             if not all_curves_exist:
                 _log.error("Demand curves: {}".format(self.building_demand_curves))
-                raise "Mix market has all quantities but not all demand curves"
+                raise RuntimeError("Mix market has all quantities but not all demand curves")
 
             # Update demand and balance market
             self.mix_market_running = False
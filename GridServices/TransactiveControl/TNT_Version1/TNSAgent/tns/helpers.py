@@ -45,12 +45,20 @@ under Contract DE-AC05-76RL01830
 import math
 import logging
 from datetime import datetime, timedelta
+from operator import attrgetter
+from dateutil import parser as _parser
 
 # from volttron.platform.agent import utils
 # utils.setup_logging()
 # _log = logging.getLogger(__name__)
 
 
+# (time interval name, value) and (time interval name, marginal price, power)
+# tuples for lists of IntervalValue objects, as published and logged
+interval_value_summary = attrgetter('timeInterval.name', 'value')
+active_vertex_summary = attrgetter('timeInterval.name', 'value.marginalPrice', 'value.power')
+
+
 def format_date(dt):
     return dt.strftime('%Y%m%d')
 
@@ -59,11 +67,16 @@ def format_ts(dt):
     return dt.strftime('%Y%m%dT%H%M%S')
 
 
-def json_econder(obj):
-    if isinstance(obj, datetime):
-        return format_ts(obj)
-    else:
-        return obj.__dict__
+def parse_iso_ts(ts):
+    # Timestamps published on the VOLTTRON message bus are ISO 8601, which the
+    # C-level datetime.fromisoformat() parses far faster than dateutil. Fall
+    # back to dateutil for other formats (or interpreters without it).
+    # transactive_base/transactive.py keeps a deliberate copy (_parse_timestamp)
+    # because transactive_utils and this package cannot import each other.
+    try:
+        return datetime.fromisoformat(ts)
+    except (AttributeError, ValueError):
+        return _parser.parse(ts)
 
 
 def get_duration_in_hour(dur):
@@ -47,6 +47,9 @@ class IntervalValue:
     An IntervalValue instance is used to keep track of a value (measurement, quality, etc.)
     with its corresponding TimeInterval instance.
     """
+    __slots__ = ('version', 'scheduled', 'associatedClass', 'associatedObject', 'id',
+                 'timeInterval', 'market', 'measurementType', 'value')
+
     def __init__(self, calling_object, time_interval, market, measurement_type, value):
         self.version = 0
         self.scheduled = True  # islogical(scheduled)
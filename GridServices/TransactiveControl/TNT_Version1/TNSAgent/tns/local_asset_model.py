@@ -139,7 +139,7 @@ class LocalAssetModel(Model, object):
         self.schedule_power(mkt)
         # Log if possible
         if self.mtn is not None and self.power_topic != '':
-            sp = [(x.timeInterval.name, x.value) for x in self.scheduledPowers]
+            sp = list(map(interval_value_summary, self.scheduledPowers))
             self.mtn.vip.pubsub.publish(peer='pubsub',
                                         topic=self.power_topic,
                                         message={'power': sp})
@@ -178,7 +178,7 @@ class LocalAssetModel(Model, object):
 
         # Gather the active time intervals ti
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.scheduledPowers = [x for x in self.scheduledPowers if x.timeInterval.startTime in time_interval_values]
 
         time_intervals.sort(key=lambda x: x.startTime)
@@ -208,8 +208,9 @@ class LocalAssetModel(Model, object):
                 # interval. Simply reassign its value
                 iv.value = default_value  # [avg.kW]
 
-        sp = [(x.timeInterval.name, x.value) for x in self.scheduledPowers]
-        _log.debug("{} asset model scheduledPowers are: {}".format(self.name, sp))
+        if _log.isEnabledFor(logging.DEBUG):
+            sp = list(map(interval_value_summary, self.scheduledPowers))
+            _log.debug("%s asset model scheduledPowers are: %s", self.name, sp)
 
     def schedule_engagement(self, mkt):
         # To assign engagement, or commitment, which
@@ -226,7 +227,7 @@ class LocalAssetModel(Model, object):
 
         # Gather the active time intervals ti
         time_intervals = mkt.timeIntervals  # active TimeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.engagementSchedule = [x for x in self.engagementSchedule if x.timeInterval.startTime in time_interval_values]
 
         # Index through the active time intervals ti
@@ -280,7 +281,7 @@ class LocalAssetModel(Model, object):
 
         # Gather the active time intervals ti
         time_intervals = mkt.timeIntervals  # active TimeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.reserveMargins = [x for x in self.reserveMargins if x.timeInterval.startTime in time_interval_values]
 
         # Index through active time intervals ti
@@ -395,7 +396,7 @@ class LocalAssetModel(Model, object):
 
         # Gather active time intervals
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.transitionCosts = [x for x in self.transitionCosts if x.timeInterval.startTime in time_interval_values]
 
         # Ensure that ti is ordered by time interval start times
@@ -451,7 +452,7 @@ class LocalAssetModel(Model, object):
 
         # Gather the active time intervals ti
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.dualCosts = [x for x in self.dualCosts if x.timeInterval.startTime in time_interval_values]
 
         # Index through the time intervals ti
@@ -497,8 +498,9 @@ class LocalAssetModel(Model, object):
         # Sum the total dual cost and save the value
         self.totalDualCost = sum([x.value for x in self.dualCosts])
 
-        dc = [(x.timeInterval.name, x.value) for x in self.dualCosts]
-        _log.debug("{} asset model dual costs are: {}".format(self.name, dc))
+        if _log.isEnabledFor(logging.DEBUG):
+            dc = list(map(interval_value_summary, self.dualCosts))
+            _log.debug("%s asset model dual costs are: %s", self.name, dc)
 
     def update_production_costs(self, mkt):
         # Calculate the costs of generated energies.
@@ -507,7 +509,7 @@ class LocalAssetModel(Model, object):
 
         # Gather active time intervals ti
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.productionCosts = [x for x in self.productionCosts if x.timeInterval.startTime in time_interval_values]
 
         # Index through the active time interval ti
@@ -561,8 +563,9 @@ class LocalAssetModel(Model, object):
         # Sum the total production cost
         self.totalProductionCost = sum([x.value for x in self.productionCosts])  # total production cost [$]
 
-        pc = [(x.timeInterval.name, x.value) for x in self.productionCosts]
-        _log.debug("{} asset model production costs are: {}".format(self.name, pc))
+        if _log.isEnabledFor(logging.DEBUG):
+            pc = list(map(interval_value_summary, self.productionCosts))
+            _log.debug("%s asset model production costs are: %s", self.name, pc)
 
     def update_vertices(self, mkt):
         # Create vertices to represent the asset's flexibility
@@ -573,7 +576,7 @@ class LocalAssetModel(Model, object):
 
         # Gather active time intervals
         ti = mkt.timeIntervals  # active TimeIntervals
-        time_interval_values = [t.startTime for t in ti]
+        time_interval_values = {t.startTime for t in ti}
         self.activeVertices = [x for x in self.activeVertices if x.timeInterval.startTime in time_interval_values]
 
         # Index through active time intervals ti
@@ -606,5 +609,6 @@ class LocalAssetModel(Model, object):
                 # assignment may be maintained.
                 iv.value = value
 
-        av = [(x.timeInterval.name, x.value.marginalPrice, x.value.power) for x in self.activeVertices]
-        _log.debug("{} asset model active vertices are: {}".format(self.name, av))
+        if _log.isEnabledFor(logging.DEBUG):
+            av = list(map(active_vertex_summary, self.activeVertices))
+            _log.debug("%s asset model active vertices are: %s", self.name, av)
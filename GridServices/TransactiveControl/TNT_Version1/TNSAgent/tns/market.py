@@ -133,25 +133,20 @@ class Market:
         # - power: system net power at the vertex (The system "clears" where
         #   system net power is zero.)
 
-        time_interval_values = [t.startTime for t in self.timeIntervals]
-        # Delete any active vertices that are not in active time intervals. This
-        # prevents time intervals from accumulating indefinitely.
-        self.activeVertices = [x for x in self.activeVertices if x.timeInterval.startTime in time_interval_values]
+        # Delete all existing aggregate active vertices. Those outside the
+        # active time intervals are stale, which prevents time intervals from
+        # accumulating indefinitely, and those inside are recreated below.
+        self.activeVertices = []
 
         for ti in self.timeIntervals:
-            # Find and delete existing aggregate active vertices in the indexed
-            # time interval. These shall be recreated.
-            self.activeVertices = [x for x in self.activeVertices if x.timeInterval.startTime != ti.startTime]
-
             # Call the utility method mkt.sum_vertices to recreate the
             # aggregate vertices in the indexed time interval. (This method is
             # separated out because it will be used by other methods.)
             s_vertices = self.sum_vertices(mtn, ti)
 
             # Create and store interval values for each new aggregate vertex v
-            for sv in s_vertices:
-                iv = IntervalValue(self, ti, self, MeasurementType.SystemVertex, sv)
-                self.activeVertices.append(iv)
+            self.activeVertices.extend(IntervalValue(self, ti, self, MeasurementType.SystemVertex, sv)
+                                       for sv in s_vertices)
 
     def balance(self, mtn):
         """
@@ -253,8 +248,9 @@ class Market:
 
             if self.method == 2:
                 self.assign_system_vertices(mtn)
-                av = [(x.timeInterval.name, x.value.marginalPrice, x.value.power) for x in self.activeVertices]
-                _log.debug("{} market active vertices are: {}".format(self.name, av))
+                if _log.isEnabledFor(logging.DEBUG):
+                    av = list(map(active_vertex_summary, self.activeVertices))
+                    _log.debug("%s market active vertices are: %s", self.name, av)
 
             # Index through active time intervals.
             for i in range(len(tis)):
@@ -834,7 +830,7 @@ class Market:
         # Extract active time intervals
         time_intervals = self.timeIntervals  # active TimeIntervals
 
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         # Delete netPowers not in active time intervals
         self.netPowers = [x for x in self.netPowers if x.timeInterval.startTime in time_interval_values]
 
@@ -940,5 +936,6 @@ class Market:
                 # A net power was found in the indexed time interval. Simply reassign its value.
                 iv.value = tg + td
 
-        np = [(x.timeInterval.name, x.value) for x in self.netPowers]
-        _log.debug("{} market netPowers are: {}".format(self.name, np))
\ No newline at end of file
+        if _log.isEnabledFor(logging.DEBUG):
+            np = list(map(interval_value_summary, self.netPowers))
+            _log.debug("%s market netPowers are: %s", self.name, np)
\ No newline at end of file
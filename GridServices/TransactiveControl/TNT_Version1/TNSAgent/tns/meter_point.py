@@ -59,7 +59,10 @@ class MeterPoint:
         self.name = ''
         self.description = ''
 
-        self.current_hour_measurements = []
+        # Running sum and count of the measurements collected this hour. Only
+        # their average is ever used, so individual samples are not kept.
+        self.current_hour_sum = 0.0
+        self.current_hour_count = 0
 
         # The measurement point datum that was collected during the last
         # reading update. This measurement must be of the measurement type
@@ -86,13 +89,15 @@ class MeterPoint:
         self.measurementUnit = MeasurementUnit.Unknown
 
     def set_meter_value(self, value, last_update=datetime.utcnow()):
-        self.current_hour_measurements.append(value)
+        self.current_hour_sum += value
+        self.current_hour_count += 1
         self.lastUpdate = last_update
 
     def update_avg(self):
-        if len(self.current_hour_measurements) > 30:
-            self.current_measurement = sum(self.current_hour_measurements) / len(self.current_hour_measurements)
-            self.current_hour_measurements = []
+        if self.current_hour_count > 30:
+            self.current_measurement = self.current_hour_sum / self.current_hour_count
+            self.current_hour_sum = 0.0
+            self.current_hour_count = 0
         return self.current_measurement
 
     def read_meter(self, obj):
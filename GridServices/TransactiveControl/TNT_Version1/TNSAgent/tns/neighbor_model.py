@@ -45,7 +45,6 @@ from datetime import datetime, timedelta, date, time
 import csv
 
 import logging
-import json
 
 from .model import Model
 from .helpers import *
@@ -115,7 +114,7 @@ class NeighborModel(Model, object):
 
         # Gather active time intervals ti
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.reserveMargins = [x for x in self.reserveMargins if x.timeInterval.startTime in time_interval_values]
 
         # Index through active time intervals ti
@@ -382,7 +381,7 @@ class NeighborModel(Model, object):
 
         # Gather the active time intervals ti
         time_intervals = mkt.timeIntervals  # TimeInterval objects
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.scheduledPowers = [x for x in self.scheduledPowers if x.timeInterval.startTime in time_interval_values]
 
         # Index through active time intervals ti
@@ -416,8 +415,9 @@ class NeighborModel(Model, object):
                 # Simply reassign its value.
                 interval_value.value = value  # [avg. kW]
 
-        sp = [(x.timeInterval.name, x.value) for x in self.scheduledPowers]
-        _log.debug("{} neighbor model scheduledPowers are: {}".format(self.name, sp))
+        if _log.isEnabledFor(logging.DEBUG):
+            sp = list(map(interval_value_summary, self.scheduledPowers))
+            _log.debug("%s neighbor model scheduledPowers are: %s", self.name, sp)
 
     def schedule_engagement(self):
         # Required from AbstractModel, but not particularly useful for any NeighborModel.
@@ -481,7 +481,7 @@ class NeighborModel(Model, object):
     def update_dual_costs(self, mkt):
         # Gather the active time intervals.
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.dualCosts = [x for x in self.dualCosts if x.timeInterval.startTime in time_interval_values]
 
         for i in range(1, len(time_intervals)):
@@ -526,12 +526,13 @@ class NeighborModel(Model, object):
         # Sum the total dual cost and save the value
         self.totalDualCost = sum([x.value for x in self.dualCosts])  # total dual cost [$]
 
-        dc = [(x.timeInterval.name, x.value) for x in self.dualCosts]
-        _log.debug("{} neighbor model dual costs are: {}".format(self.name, dc))
+        if _log.isEnabledFor(logging.DEBUG):
+            dc = list(map(interval_value_summary, self.dualCosts))
+            _log.debug("%s neighbor model dual costs are: %s", self.name, dc)
 
     def update_production_costs(self, mkt):
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
+        time_interval_values = {t.startTime for t in time_intervals}
         self.productionCosts = [x for x in self.productionCosts if x.timeInterval.startTime in time_interval_values]
 
         for i in range(1, len(time_intervals)):
@@ -571,8 +572,9 @@ class NeighborModel(Model, object):
         # self.totalProductionCost = sum([self.productionCosts.value])  # total production cost [$]
         self.totalProductionCost = sum([x.value for x in self.productionCosts])  # total production cost [$]
 
-        pc = [(x.timeInterval.name, x.value) for x in self.productionCosts]
-        _log.debug("{} neighbor model production costs are: {}".format(self.name, pc))
+        if _log.isEnabledFor(logging.DEBUG):
+            pc = list(map(interval_value_summary, self.productionCosts))
+            _log.debug("%s neighbor model production costs are: %s", self.name, pc)
 
     def update_vertices(self, mkt):
         # Update the active vertices that define Neighbors'
@@ -602,31 +604,25 @@ class NeighborModel(Model, object):
 
         # Extract active time intervals
         time_intervals = mkt.timeIntervals
-        time_interval_values = [t.startTime for t in time_intervals]
 
-        # Delete any active vertices that are not in active time intervals. This
-        # prevents time intervals from accumulating indefinitely.
-        self.activeVertices = [x for x in self.activeVertices if x.timeInterval.startTime in time_interval_values]
+        # Get the default vertices.
+        default_vertices = self.defaultVertices
+
+        if len(default_vertices) == 0:
+            # No default vertices are found. Warn and return.
+            _log.warning('At least one default vertex must be defined for neighbor model object %s. '
+                         'Scheduling was not performed' % (self.name))
+            return
+
+        # Delete all existing active vertices. Those not in active time
+        # intervals are stale, which prevents time intervals from accumulating
+        # indefinitely, and those in active time intervals are recreated below.
+        self.activeVertices = []
 
         for i in range(len(time_intervals)):
             # Flag for logging demand charge 1st time only
             dc_logged = False
 
-            # Keep active vertices that are not in the indexed time interval, but
-            # discard the one(s) in the indexed time interval. These shall be
-            # recreated in this iteration.
-            self.activeVertices = [x for x in self.activeVertices if
-                                   x.timeInterval.startTime != time_interval_values[i]]
-
-            # Get the default vertices.
-            default_vertices = self.defaultVertices
-
-            if len(default_vertices) == 0:
-                # No default vertices are found. Warn and return.
-                _log.warning('At least one default vertex must be defined for neighbor model object %s. '
-                             'Scheduling was not performed' % (self.name))
-                return
-
             if not self.transactive:  # Neighbor is non-transactive
                 # Default vertices were found. Index through the default vertices.
                 for k in range(len(default_vertices)):
@@ -886,8 +882,9 @@ class NeighborModel(Model, object):
                 # Logic should not arrive here. Error.
                 raise ('Neighbor %s must be either transactive or not.' % (self.name))
 
-        av = [(x.timeInterval.name, x.value.marginalPrice, x.value.power) for x in self.activeVertices]
-        _log.debug("{} neighbor model active vertices are: {}".format(self.name, av))
+        if _log.isEnabledFor(logging.DEBUG):
+            av = list(map(active_vertex_summary, self.activeVertices))
+            _log.debug("%s neighbor model active vertices are: %s", self.name, av)
 
     def prep_transactive_signal(self, mkt, mtn):
         # Prepare transactive records to send
@@ -1085,12 +1082,12 @@ class NeighborModel(Model, object):
             _log.warning("No transactive records were found. No transactive signal can be sent to %s." % self.name)
             return
 
-        msg = json.dumps(transactive_records, default=json_econder)
-        msg = json.loads(msg)
-        _log.debug("At {}, {} sends signal from {} on topic {} message {}"
-                   .format(Timer.get_cur_time(),
-                           self.name,
-                           self.location, topic, msg))
+        # Records hold only primitives apart from their creation timestamp, so
+        # build the message dicts directly rather than round-tripping through JSON.
+        msg = [dict(tr.__dict__, timeStamp=format_ts(tr.timeStamp)) for tr in transactive_records]
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("At %s, %s sends signal from %s on topic %s message %s",
+                       Timer.get_cur_time(), self.name, self.location, topic, msg)
         mtn.vip.pubsub.publish(peer='pubsub',
                                topic=topic,
                                message={'source': self.location,
@@ -1118,21 +1115,19 @@ class NeighborModel(Model, object):
                          'No signal is read.')
             return
 
-        self.receivedSignal = []
-        for curve in curves:
-            transative_record = TransactiveRecord(ti=curve['timeInterval'],
-                                                  rn=int(curve['record']),
-                                                  mp=float(curve['marginalPrice']),
-                                                  p=float(curve['power']),
-                                                  cost=float(curve['cost']))
-                                                  # pu=float(curve['powerUncertainty']),
-                                                  # rp=float(curve['reactivePower']),
-                                                  # rpu=float(curve['reactivePowerUncertainty']),
-                                                  # v=float(curve['voltage']),
-                                                  # vu=float(curve['voltageUncertainty']))
-
-            # Save each transactive record
-            self.receivedSignal.append(transative_record)
+        # Save each transactive record
+        self.receivedSignal = [TransactiveRecord(ti=curve['timeInterval'],
+                                                 rn=int(curve['record']),
+                                                 mp=float(curve['marginalPrice']),
+                                                 p=float(curve['power']),
+                                                 cost=float(curve['cost']),
+                                                 # pu=float(curve['powerUncertainty']),
+                                                 # rp=float(curve['reactivePower']),
+                                                 # rpu=float(curve['reactivePowerUncertainty']),
+                                                 # v=float(curve['voltage']),
+                                                 # vu=float(curve['voltageUncertainty']),
+                                                 )
+                               for curve in curves]
 
 
 if __name__ == '__main__':
@@ -101,6 +101,11 @@ class TccModel(LocalAssetModel):
             # Curves existed, update vertices first
             self.update_vertices(mkt)
 
+            # Index marginal prices by interval start time (first match wins, as with find_obj_by_ti)
+            marginal_prices = {}
+            for mp in mkt.marginalPrices:
+                marginal_prices.setdefault(mp.timeInterval.startTime, mp)
+
         for i in range(len(time_intervals)):
             value = self.defaultPower
             # if self.quantities is not None and len(self.quantities) > i and self.quantities[i] is not None:
@@ -108,15 +113,15 @@ class TccModel(LocalAssetModel):
 
             if self.tcc_curves is not None:
                 # Update power at this marginal_price
-                marginal_price = find_obj_by_ti(mkt.marginalPrices, time_intervals[i])
-                marginal_price = marginal_price.value
+                marginal_price = marginal_prices[time_intervals[i].startTime].value
                 value = production(self, marginal_price, time_intervals[i])  # [avg. kW]
 
             iv = IntervalValue(self, time_intervals[i], mkt, MeasurementType.ScheduledPower, value)
             self.scheduledPowers.append(iv)
 
-        sp = [(x.timeInterval.name, x.value) for x in self.scheduledPowers]
-        _log.debug("TCC scheduledPowers are: {}".format(sp))
+        if _log.isEnabledFor(logging.DEBUG):
+            sp = list(map(interval_value_summary, self.scheduledPowers))
+            _log.debug("TCC scheduledPowers are: %s", sp)
 
     def update_vertices(self, mkt):
         if self.tcc_curves is None:
@@ -155,5 +160,6 @@ class TccModel(LocalAssetModel):
                     iv2 = IntervalValue(self, time_intervals[i], mkt, MeasurementType.ActiveVertex, v2)
                     self.activeVertices.append(iv2)
 
-        av = [(x.timeInterval.name, x.value.marginalPrice, x.value.power) for x in self.activeVertices]
-        _log.debug("TCC active vertices are: {}".format(av))
+        if _log.isEnabledFor(logging.DEBUG):
+            av = list(map(active_vertex_summary, self.activeVertices))
+            _log.debug("TCC active vertices are: %s", av)
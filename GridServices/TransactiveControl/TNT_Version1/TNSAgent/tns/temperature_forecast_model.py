@@ -54,6 +54,7 @@ from .information_service_model import InformationServiceModel
 from .measurement_type import MeasurementType
 from .measurement_unit import MeasurementUnit
 from .interval_value import IntervalValue
+from .helpers import parse_iso_ts
 
 from volttron.platform.agent import utils
 from volttron.platform.jsonrpc import RemoteError
@@ -142,8 +143,13 @@ class TemperatureForecastModel(InformationServiceModel, object):
 
         if weather_results is not None:
             try:
-                weather_data = [[parser.parse(oat[0]).astimezone(self.localtz), oat[1][self.oat_point_name]] for oat in weather_results]
-                weather_data = [[oat[0].replace(tzinfo=None), oat[1]] for oat in weather_data]
+                # Index forecast values by naive local timestamp in a single pass
+                # (the first value for a timestamp wins).
+                forecast = {}
+                for oat in weather_results:
+                    ts = parse_iso_ts(oat[0]).astimezone(self.localtz).replace(tzinfo=None)
+                    forecast.setdefault(ts, oat[1][self.oat_point_name])
+                weather_data = forecast
             except KeyError:
                 if not self.predictedValues:
                     raise Exception("Measurement Point Name is not correct")
@@ -159,11 +165,10 @@ class TemperatureForecastModel(InformationServiceModel, object):
             for ti in mkt.timeIntervals:
                 # Find item which has the same timestamp as ti.timeStamp
                 start_time = ti.startTime.replace(minute=0)
-                items = [x[1] for x in weather_data if x[0] == start_time]
 
                 # Create interval value and add it to predicted values
-                if items:
-                    temp = items[0]
+                if start_time in weather_data:
+                    temp = weather_data[start_time]
                     interval_value = IntervalValue(self, ti, mkt, MeasurementType.PredictedValue, temp)
                     self.predictedValues.append(interval_value)
         elif self.predictedValues:
@@ -43,6 +43,10 @@ under Contract DE-AC05-76RL01830
 
 
 class Vertex:
+    # Vertices are created per time interval on every market balance; slots
+    # keep each instance small and attribute access fast.
+    __slots__ = ('cost', 'marginalPrice', 'power', 'powerUncertainty', 'continuity')
+
     def __init__(self, marginal_price, prod_cost, power, continuity=True, power_uncertainty=0.0):
         # Production cost. A dynamic representation of the delivered
         # cost. An ideal is that the cost of electricity using this price should be equivalent to
@@ -82,6 +82,9 @@ class TransactiveIlcCoordinator(MarketAgent):
         logging_topic = config.get("logging_topic", "record")
         self.target_topic = '/'.join(['record', 'target_agent', campus, building, 'goal'])
         self.logging_topic = '/'.join([logging_topic, campus, building, "TCILC"])
+        self.demand_curve_topic = '/'.join([self.logging_topic, "DemandCurve"])
+        self.market_clear_topic = '/'.join([self.logging_topic, "MarketClear"])
+        self.flexibility_topic = '/'.join([self.logging_topic, "BuildingFlexibility"])
         cluster_configs = config["clusters"]
         self.clusters = ClusterContainer()
 
@@ -199,9 +202,8 @@ class TransactiveIlcCoordinator(MarketAgent):
             demand_curve = self.create_demand_curve()
             if demand_curve is not None:
                 self.make_offer(market_name, buyer_seller, demand_curve)
-                topic_suffix = "/".join([self.logging_topic, "DemandCurve"])
                 message = {"Curve": demand_curve.tuppleize(), "Commodity": "Electricity"}
-                self.publish_record(topic_suffix, message)
+                self.publish_record(self.demand_curve_topic, message)
 
     def create_demand_curve(self):
         if self.power_min is not None and self.power_max is not None:
@@ -237,8 +239,7 @@ class TransactiveIlcCoordinator(MarketAgent):
             price = "None"
             demand_goal = "None"
         message = {"Price": price, "Quantity": demand_goal, "Commodity": "Electricity"}
-        topic_suffix = "/".join([self.logging_topic, "MarketClear"])
-        self.publish_record(topic_suffix, message)
+        self.publish_record(self.market_clear_topic, message)
 
     def publish_demand_limit(self, demand_goal, task_id):
         """
@@ -347,9 +348,8 @@ class TransactiveIlcCoordinator(MarketAgent):
         power_max, power_min = self.generate_power_points(current_power)
         _log.debug("QUANTITIES: max {} - min {} - cur {}".format(power_max, power_min, current_power))
 
-        topic_suffix = "/".join([self.logging_topic, "BuildingFlexibility"])
         message = {"MaximumPower": power_max, "MinimumPower": power_min, "AveragePower": current_power}
-        self.publish_record(topic_suffix, message)
+        self.publish_record(self.flexibility_topic, message)
 
         if self.bldg_power:
             current_average_window = self.bldg_power[-1][0] - self.bldg_power[0][0] + td(seconds=15)
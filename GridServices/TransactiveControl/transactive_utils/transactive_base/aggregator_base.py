@@ -43,7 +43,7 @@ class Aggregator(TransactiveBase):
         config.update(contents)
         self.configure_main(config_name, action, contents)
         _log.debug("Update agent %s configuration.", self.core.identity)
-        if action == "NEW" or "UPDATE":
+        if action in ("NEW", "UPDATE"):
             supplier_market_base_name = config.get("supplier_market_name", "")
             self.supply_commodity = supplier_market_base_name
             consumer_market_base_name = config.get("consumer_market_name", [])
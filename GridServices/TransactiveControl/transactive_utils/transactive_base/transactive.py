@@ -1,6 +1,8 @@
 import logging
 import sys
-from datetime import timedelta as td
+import json
+import hashlib
+from datetime import datetime, timedelta as td
 import numpy as np
 
 from dateutil.parser import parse
@@ -25,6 +27,20 @@ setup_logging()
 __version__ = '0.3'
 
 
+# Deliberate copy of tns.helpers.parse_iso_ts: transactive_utils and the
+# TNT_Version1 tns package are installed separately and cannot import each other.
+def _parse_timestamp(ts):
+    """
+    Parse ISO 8601 timestamp, falling back to dateutil.
+    :param ts: str; timestamp
+    :return: datetime
+    """
+    try:
+        return datetime.fromisoformat(ts)
+    except (AttributeError, ValueError):
+        return parse(ts)
+
+
 class TransactiveBase(MarketAgent, Model):
     def __init__(self, config, aggregator=None, **kwargs):
         MarketAgent.__init__(self, **kwargs)
@@ -65,6 +81,7 @@ class TransactiveBase(MarketAgent, Model):
         self.day_ahead_prices = []
         self.last_24_hour_prices = []
         self.input_topics = set()
+        self._subs = {}
 
         self.commodity = "electricity"
         self.update_flag = []
@@ -78,6 +95,7 @@ class TransactiveBase(MarketAgent, Model):
 
         # Variables declared in configure_main
         self.record_topic = None
+        self.record_topics = {}
         self.market_number = None
         self.single_market_contol_interval = None
         self.hour_prediction_offset = 1
@@ -95,6 +113,7 @@ class TransactiveBase(MarketAgent, Model):
         self.default_min_price = 0.01
         self.default_max_price = 0.1
         self.oat_predictions = []
+        self._last_config_hash = None
         if config:
             default_config.update(config)
             self.default_config = default_config
@@ -106,10 +125,16 @@ class TransactiveBase(MarketAgent, Model):
                                   pattern="config")
 
     def configure_main(self, config_name, action, contents, **kwargs):
+        # Reprocessing the configuration tears down and rebuilds inputs,
+        # outputs, schedule, and model, so skip an UPDATE when nothing changed.
+        config_hash = hashlib.sha256(json.dumps(contents, sort_keys=True, default=str).encode()).digest()
+        if action == "UPDATE" and config_hash == self._last_config_hash:
+            _log.debug("Configuration for %s unchanged -- skipping %s", self.core.identity, action)
+            return
         config = self.default_config.copy()
         config.update(contents)
         _log.debug("Update agent %s configuration -- config --  %s", self.core.identity, config)
-        if action == "NEW" or "UPDATE":
+        if action in ("NEW", "UPDATE"):
             campus = config.get("campus", "")
             building = config.get("building", "")
             device = config.get("device", "")
@@ -119,6 +144,7 @@ class TransactiveBase(MarketAgent, Model):
             base_record_list = ["tnc", campus, building, device, subdevice]
             base_record_list = list(filter(lambda a: a != "", base_record_list))
             self.record_topic = '/'.join(base_record_list)
+            self.record_topics = {}
             self.actuate_onstart = config.get("actuation_enabled_onstart", True)
             self.actuation_disabled = True if not self.actuate_onstart else False
             self.actuation_method = config.get("actuation_method")
@@ -134,14 +160,15 @@ class TransactiveBase(MarketAgent, Model):
             self.input_data_tz = dateutil.tz.gettz(input_data_tz)
             inputs = config.get("inputs", [])
             schedule = config.get("schedule")
-            self.clear_input_subscriptions()
-            self.input_topics = set()
+            previous_topics = self.input_topics
             self.init_inputs(inputs)
+            # Only touch subscriptions for topics that were added or removed.
+            self.clear_input_subscriptions(previous_topics - self.input_topics)
+            self.init_input_subscriptions(self.input_topics - previous_topics)
             self.init_schedule(schedule)
             outputs = config.get("outputs")
             self.init_outputs(outputs)
             self.init_actuation_state(self.actuate_topic, self.actuate_onstart)
-            self.init_input_subscriptions()
             self.static_price_flag = config.get('static_price_flag', False)
             self.default_min_price = config.get('static_minimum_price', 0.01)
             self.default_max_price = config.get('static_maximum_price', 0.1)
@@ -172,6 +199,9 @@ class TransactiveBase(MarketAgent, Model):
                     _log.debug("%s is a transactive agent.", self.core.identity)
                     self.init_markets()
             self.setup()
+            # Only remember the configuration once it has been fully applied
+            # so a failed attempt is retried when the same contents are stored.
+            self._last_config_hash = config_hash
 
     def setup(self, **kwargs):
         """
@@ -184,13 +214,41 @@ class TransactiveBase(MarketAgent, Model):
             self.update_prices = self.update_rtp_prices
         else:
             self.update_prices = self.update_tns_prices
+        self.update_subscription("prices", 'mixmarket/start_new_cycle', self.update_prices)
+        self.update_subscription("model", "/".join([self.record_topic, "update_model"]), self.update_model)
+
+    def update_subscription(self, name, topic, callback):
+        """
+        Install the named subscription, replacing the one previously
+        installed under that name only if the topic or callback changed.
+        :param name: str; key for the subscription
+        :param topic: str; topic prefix
+        :param callback: subscription callback
+        :return: None
+        """
+        current = self._subs.get(name)
+        if current == (topic, callback):
+            return
+        if current is not None:
+            self.vip.pubsub.unsubscribe(peer='pubsub',
+                                        prefix=current[0],
+                                        callback=current[1])
         self.vip.pubsub.subscribe(peer='pubsub',
-                                  prefix='mixmarket/start_new_cycle',
-                                  callback=self.update_prices)
-        self.vip.pubsub.subscribe(peer='pubsub',
-                                  prefix="/".join([self.record_topic,
-                                                   "update_model"]),
-                                  callback=self.update_model)
+                                  prefix=topic,
+                                  callback=callback)
+        self._subs[name] = (topic, callback)
+
+    def remove_subscription(self, name):
+        """
+        Remove the named subscription if one is installed.
+        :param name: str; key for the subscription
+        :return: None
+        """
+        current = self._subs.pop(name, None)
+        if current is not None:
+            self.vip.pubsub.unsubscribe(peer='pubsub',
+                                        prefix=current[0],
+                                        callback=current[1])
 
     @Core.receiver("onstop")
     def shutdown(self, sender, **kwargs):
@@ -219,6 +277,9 @@ class TransactiveBase(MarketAgent, Model):
             self.demand_curve.append(PolyLine())
 
     def init_inputs(self, inputs):
+        # Build the topic set aside so input_topics keeps matching the live
+        # subscriptions if an input fails to parse.
+        input_topics = set()
         for input_info in inputs:
             try:
                 point = input_info["point"]
@@ -230,9 +291,14 @@ class TransactiveBase(MarketAgent, Model):
 
             value = input_info.get("initial_value")
             self.inputs[mapped] = {point: value}
-            self.input_topics.add(topic)
+            input_topics.add(topic)
+        self.input_topics = input_topics
 
     def init_outputs(self, outputs):
+        # Rebuild from the configuration so outputs (and the actuation
+        # subscription that depends on them) do not outlive their config.
+        previous_outputs = self.outputs
+        configured_outputs = {}
         for output_info in outputs:
             # Topic to subscribe to for data (currently data format must be
             # consistent with a MasterDriverAgent all publish)
@@ -273,7 +339,7 @@ class TransactiveBase(MarketAgent, Model):
             else:
                 release_value = None
             off_setpoint = output_info.get("off_setpoint", value)
-            self.outputs[mapped] = {
+            configured_outputs[mapped] = {
                 "point": point,
                 "topic": topic,
                 "actuator": actuator,
@@ -285,29 +351,41 @@ class TransactiveBase(MarketAgent, Model):
                 "ct_flex": ct_flex,
                 "condition": condition
             }
+        self.outputs = configured_outputs
+        # Release points that are no longer configured, as shutdown would.
+        if self.actuation_enabled:
+            for name in set(previous_outputs) - set(configured_outputs):
+                output_info = previous_outputs[name]
+                self.actuate(output_info["topic"], output_info["release"], output_info["actuator"])
 
     def set_control(self, ct_flex, flex):
         ct_flex = np.linspace(ct_flex[0], ct_flex[1], 11)
         flex = np.linspace(flex[0], flex[1], 11)
         return ct_flex, flex
 
-    def init_input_subscriptions(self):
+    def init_input_subscriptions(self, topics=None):
         """
         Create topic subscriptions for devices.
+        :param topics: set; topics to subscribe to, defaults to all input topics
         :return:
         """
-        for topic in self.input_topics:
+        if topics is None:
+            topics = self.input_topics
+        for topic in topics:
             _log.debug('Subscribing to: ' + topic)
             self.vip.pubsub.subscribe(peer='pubsub',
                                       prefix=topic,
                                       callback=self.update_input_data)
 
-    def clear_input_subscriptions(self):
+    def clear_input_subscriptions(self, topics=None):
         """
-        Create topic subscriptions for devices.
+        Remove topic subscriptions for devices.
+        :param topics: set; topics to unsubscribe from, defaults to all input topics
         :return:
         """
-        for topic in self.input_topics:
+        if topics is None:
+            topics = self.input_topics
+        for topic in topics:
             _log.debug('Unubscribing to: ' + topic)
             self.vip.pubsub.unsubscribe(peer='pubsub',
                                         prefix=topic,
@@ -340,12 +418,11 @@ class TransactiveBase(MarketAgent, Model):
         :return:
         """
         if self.outputs:
-            self.vip.pubsub.subscribe(peer='pubsub',
-                                      prefix=actuate_topic,
-                                      callback=self.update_actuation_state)
+            self.update_subscription("actuation", actuate_topic, self.update_actuation_state)
             if actuate_onstart:
                 self.update_actuation_state(None, None, None, None, None, True)
         else:
+            self.remove_subscription("actuation")
             _log.info("%s - cannot initialize actuation state, "
                       "no configured outputs.", self.core.identity)
 
@@ -602,7 +679,7 @@ class TransactiveBase(MarketAgent, Model):
 
     def update_tns_prices(self, peer, sender, bus, topic, headers, message):
         _log.debug("Get prices prior to market start.")
-        current_hour = parse(message['Date']).hour
+        current_hour = _parse_timestamp(message['Date']).hour
 
         # Store received prices so we can use it later when doing clearing process
         if self.day_ahead_prices:
@@ -684,7 +761,7 @@ class TransactiveBase(MarketAgent, Model):
         # data is assumed to be in format from VOLTTRON master driver.
         data = message[0]
         try:
-            current_datetime = parse(headers.get("Date"))
+            current_datetime = _parse_timestamp(headers.get("Date"))
         except TypeError:
             _log.debug("%s could not parse Datetime in input data payload!",
                        self.core.identity)
@@ -703,11 +780,12 @@ class TransactiveBase(MarketAgent, Model):
         :return:
         """
         to_publish = {}
-        for name, input_data in self.inputs.items():
-            for point, value in input_data.items():
+        for input_data in self.inputs.values():
+            for point in input_data:
                 if point in data:
-                    self.inputs[name][point] = data[point]
-                    to_publish[point] = data[point]
+                    value = data[point]
+                    input_data[point] = value
+                    to_publish[point] = value
         topic_suffix = "InputData"
         message = to_publish
         self.publish_record(topic_suffix, message)
@@ -757,5 +835,7 @@ class TransactiveBase(MarketAgent, Model):
     def publish_record(self, topic_suffix, message):
         headers = {headers_mod.DATE: format_timestamp(get_aware_utc_now())}
         message["TimeStamp"] = format_timestamp(self.current_datetime)
-        topic = "/".join([self.record_topic, topic_suffix])
-        self.vip.pubsub.publish("pubsub", topic, headers, message).get()
+        topic = self.record_topics.get(topic_suffix)
+        if topic is None:
+            topic = self.record_topics[topic_suffix] = "/".join([self.record_topic, topic_suffix])
+        self.vip.pubsub.publish("pubsub", topic, headers, message)